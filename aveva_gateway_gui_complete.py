@@ -13,24 +13,489 @@ Features:
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox, scrolledtext, font as tkfont
 import os
+import re
 import sys
 import json
+import functools
+import collections
 import threading
-import subprocess
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-import webbrowser
-import shutil
+import importlib
 
-# Try to import the gateway module
+# Optional fast JSON encoder/decoder
 try:
-    from document_indexing_gateway_complete import DocumentIndexingGateway, ProjectConfig
-    GATEWAY_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    GATEWAY_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Optional filesystem events for monitor mode (falls back to polling)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+# Gateway module is imported in the background (None = still loading)
+GATEWAY_AVAILABLE = None
+
+# Named fonts, created once in setup_styles (resizing one restyles every user)
+FONT_BASE = 'GatewayBase'
+FONT_BOLD = 'GatewayBold'
+FONT_TITLE = 'GatewayTitle'
+
+FONT_SPEC = (
+    (FONT_BASE, {'family': 'Segoe UI', 'size': 9}),
+    (FONT_BOLD, {'family': 'Segoe UI', 'size': 9, 'weight': 'bold'}),
+    (FONT_TITLE, {'family': 'Segoe UI', 'size': 11, 'weight': 'bold'}),
+)
+
+# ttk style definitions, applied in a single pass by setup_styles
+STYLE_TABLE = (
+    ('TFrame', {'background': '#ffffff'}),
+    ('Header.TFrame', {'background': '#f0f0f0'}),
+    
+    ('TLabel', {'background': '#ffffff', 'font': FONT_BASE}),
+    ('Header.TLabel', {'background': '#f0f0f0', 'font': FONT_BASE}),
+    ('Title.TLabel', {'font': FONT_TITLE}),
+    ('Section.TLabel', {'font': FONT_BOLD}),
+    
+    ('TButton', {'font': FONT_BASE}),
+    ('Action.TButton', {'font': FONT_BOLD}),
+    
+    ('TCheckbutton', {'background': '#ffffff', 'font': FONT_BASE}),
+    ('TLabelframe', {'background': '#ffffff', 'font': FONT_BASE}),
+    ('TLabelframe.Label', {'background': '#ffffff', 'font': FONT_BOLD}),
+)
+
+# ttk state maps, declared up front instead of resolved from theme defaults
+STYLE_MAP = (
+    ('TButton', {'background': [('pressed', '#d0d0d0'), ('active', '#e8e8e8')]}),
+    ('TEntry', {'fieldbackground': [('readonly', '#f8f8f8')]}),
+)
+
+# Preferred themes, first available wins
+PREFERRED_THEMES = ('vista', 'clam')
+_theme = None
+
+# Process DPI awareness is set at most once
+_dpi_initialized = False
+
+# Tk variables created by setup_variables: (attribute, type, default)
+VAR_SPEC = (
+    # Project
+    ('project_name', tk.StringVar, "My P&ID Project"),
+    ('config_location', tk.StringVar, ""),
+    
+    # Folders
+    ('source_folder', tk.StringVar, ""),
+    ('destination_folder', tk.StringVar, ""),
+    ('staging_area', tk.StringVar, ""),
+    ('processed_folder', tk.StringVar, ""),
+    ('unprocessed_folder', tk.StringVar, ""),
+    ('log_folder', tk.StringVar, ""),
+    
+    # AVEVA Standard Options
+    ('include_subfolders', tk.BooleanVar, True),
+    ('copy_source_files', tk.BooleanVar, True),
+    ('copy_other_files', tk.BooleanVar, False),
+    ('move_processed', tk.BooleanVar, True),
+    ('search_filenames_for_tags', tk.BooleanVar, False),
+    ('create_trigger_file', tk.BooleanVar, True),
+    ('insert_line_breaks', tk.BooleanVar, True),
+    ('object_id_from_vnet', tk.BooleanVar, False),
+    
+    # Pattern mapping
+    ('pattern_file', tk.StringVar, ""),
+    ('default_context', tk.StringVar, "Plant|Process Area"),
+    
+    # Spreadsheet settings
+    ('use_ranges', tk.BooleanVar, False),
+    ('document_type', tk.StringVar, "xlsx"),
+    
+    # Timeouts
+    ('open_file_timeout_enabled', tk.BooleanVar, True),
+    ('open_file_timeout', tk.IntVar, 30),
+    ('processing_timeout_enabled', tk.BooleanVar, False),
+    ('processing_timeout', tk.DoubleVar, 60.0),
+    ('als_retry_timeout', tk.IntVar, 120),
+    
+    # Conversion
+    ('convert_doc', tk.BooleanVar, False),
+    ('convert_xls', tk.BooleanVar, False),
+    
+    # OCR settings
+    ('use_ocr', tk.BooleanVar, True),
+    ('ocr_language', tk.StringVar, "eng"),
+    ('ocr_dpi', tk.IntVar, 300),
+    ('extract_vertical_text', tk.BooleanVar, True),
+    ('rotate_for_ocr', tk.BooleanVar, True),
+    
+    # Advanced OCR
+    ('adaptive_dpi', tk.BooleanVar, True),
+    ('dpi_min', tk.IntVar, 300),
+    ('dpi_max', tk.IntVar, 500),
+    ('preprocess_images', tk.BooleanVar, True),
+    ('enhance_contrast', tk.DoubleVar, 1.5),
+    ('enhance_sharpness', tk.DoubleVar, 1.5),
+    ('denoise', tk.BooleanVar, True),
+    ('use_multi_pass_ocr', tk.BooleanVar, True),
+    ('detect_regions', tk.BooleanVar, True),
+    ('min_text_confidence', tk.IntVar, 60),
+    ('save_debug_images', tk.BooleanVar, False),
+    
+    # Processing mode
+    ('processing_mode', tk.StringVar, "balanced"),
+)
+
+# Folder rows on the Locations tab: (label, attribute, required)
+FOLDER_SPEC = (
+    ("Source Folder:", 'source_folder', True),
+    ("Destination Folder:", 'destination_folder', False),
+    ("Staging Area:", 'staging_area', True),
+    ("Processed Folder:", 'processed_folder', False),
+    ("Unprocessed Folder:", 'unprocessed_folder', False),
+    ("Log Folder:", 'log_folder', False),
+)
+
+# Saved configuration fields: (JSON key, attribute), in file order
+CONFIG_FIELDS = (
+    ("name", 'project_name'),
+    *((attr, attr) for _, attr, _ in FOLDER_SPEC),
+    ("pattern_mapping_file", 'pattern_file'),
+    *((name, name) for name in (
+        'default_context',
+        
+        'include_subfolders', 'copy_source_files', 'copy_other_files', 'move_processed',
+        'search_filenames_for_tags', 'create_trigger_file', 'insert_line_breaks',
+        'object_id_from_vnet',
+        
+        'use_ranges', 'document_type',
+        
+        'open_file_timeout_enabled', 'open_file_timeout', 'processing_timeout_enabled',
+        'processing_timeout', 'als_retry_timeout',
+        
+        'convert_doc', 'convert_xls',
+        
+        'use_ocr', 'ocr_language', 'ocr_dpi', 'extract_vertical_text', 'rotate_for_ocr',
+        
+        'adaptive_dpi', 'dpi_min', 'dpi_max', 'preprocess_images', 'enhance_contrast',
+        'enhance_sharpness', 'denoise', 'use_multi_pass_ocr', 'detect_regions',
+        'min_text_confidence', 'save_debug_images',
+    )),
+)
+
+# Values used for keys missing from a loaded file (the variable defaults,
+# except that project name and context are left blank)
+VAR_DEFAULTS = {name: default for name, _, default in VAR_SPEC}
+CONFIG_DEFAULTS = {
+    **{key: VAR_DEFAULTS[attr] for key, attr in CONFIG_FIELDS},
+    "name": "",
+    "default_context": "",
+}
+# Checkbutton groups: (text, attribute)
+FILE_OPTIONS = (
+    ("Copy Source Files to Staging Area", 'copy_source_files'),
+    ("Copy Other Files to Staging Area", 'copy_other_files'),
+    ("Search File Names for Tags", 'search_filenames_for_tags'),
+    ("Create Trigger File (trigger.start)", 'create_trigger_file'),
+    ("Move Processed and Unprocessed Files", 'move_processed'),
+    ("Insert Line Breaks", 'insert_line_breaks'),
+    ("Object ID from VNet File", 'object_id_from_vnet'),
+)
+
+CONVERSION_OPTIONS = (
+    ("Convert .doc Source Files to .docx before processing", 'convert_doc'),
+    ("Convert .xls Source Files to .xlsx before processing", 'convert_xls'),
+)
+
+OCR_TEXT_OPTIONS = (
+    ("Extract Vertical Text (rotated tags)", 'extract_vertical_text'),
+    ("Rotate for OCR (multiple angles: 0°, 90°, 180°, 270°)", 'rotate_for_ocr'),
+)
+
+OCR_ADVANCED_OPTIONS = (
+    ("Multi-Pass OCR (4-8 passes per region for maximum accuracy)", 'use_multi_pass_ocr'),
+    ("Smart Region Detection (title block, table, equipment zones)", 'detect_regions'),
+)
+
+# Processing mode presets: attribute -> value
+MODE_PRESETS = {
+    "fast": {
+        'adaptive_dpi': False,
+        'preprocess_images': False,
+        'use_multi_pass_ocr': False,
+        'detect_regions': False,
+    },
+    "balanced": {
+        'adaptive_dpi': True,
+        'dpi_max': 500,
+        'preprocess_images': True,
+        'use_multi_pass_ocr': True,
+        'detect_regions': True,
+    },
+    "high_quality": {
+        'adaptive_dpi': True,
+        'dpi_max': 600,
+        'preprocess_images': True,
+        'enhance_contrast': 2.0,
+        'enhance_sharpness': 2.0,
+        'denoise': True,
+        'use_multi_pass_ocr': True,
+        'detect_regions': True,
+    },
+}
+
+# Static help text shown on the tabs
+OCR_BASIC_HELP = """📋 Basic OCR Settings Guide:
+
+Language: Select OCR language (eng = English)
+Base DPI: Image resolution (300 = standard, 400-600 = better quality for small text)
+
+Extract Vertical Text: Detects tags rotated 90° (common in P&IDs)
+Rotate for OCR: Tries multiple angles to capture text at any orientation
+
+💡 For complex P&IDs with small text, tables, or mixed orientations:
+   Enable "OCR Advanced" tab for intelligent multi-pass processing"""
+
+PATTERNS_HELP = """📋 Pattern Mapping Guide (AVEVA NET Standard):
+
+Pattern mapping uses regular expressions to identify and classify tags in documents.
+
+Example Pattern File (XML):
+─────────────────────────────────────────────────────────────────
+<?xml version="1.0" encoding="UTF-8"?>
+<Patterns version="5.0">
+  <!-- Equipment Tags: ###-X-##### -->
+  <Pattern from="\\d{3}-[A-Z]-\\d{5}" to="Equipment"/>
+  
+  <!-- Valve Tags: ###-HV-##### -->
+  <Pattern from="\\d{3}-HV-\\d{5}" to="Valve"/>
+  
+  <!-- Complex Pipeline: ###-XX-#####-##"-XXXXXXX-XX-### -->
+  <Pattern from="\\d{3}-[A-Z]{2}-\\d{5}-\\d{1,2}\\"-[A-Z0-9]{6,8}-[A-Z]{2}-\\d{3}" 
+           to="PipeLine"/>
+  
+  <!-- Motor Tags with Expansion -->
+  <Pattern from="\\d{3}-EM-\\d{5}[A-Z]-[A-Z]" to="Motor">
+    <Expand Interpolate="true">
+      <SubPattern>[A-Z]-[A-Z]</SubPattern>
+      <Char>-</Char>
+    </Expand>
+  </Pattern>
+  
+  <!-- Tag with Replacement -->
+  <Pattern from="[A-Z]-\\d{3}" to="Valve">
+    <Replace>
+      <Original>[A-Z]-</Original>
+      <Replacement>[A-Z]</Replacement>
+    </Replace>
+  </Pattern>
+</Patterns>
+─────────────────────────────────────────────────────────────────
+
+Supported Features:
+• Regular expression patterns (from="...")
+• Classification (to="...")
+• Context override (context="...")
+• Tag expansion with interpolation
+• String replacement
+• String insertion
+• Exclusion patterns
+
+For your P&ID project, use the provided 'pattern_mapping_precise.xml' file."""
+
+FILE_TYPES_HELP = """Supported formats: PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, TXT, ZIP, RTF, DWG
+Configure additional file types in the configuration XML file."""
+
+CMD_HELP = """Command Line Arguments (AVEVA NET Standard):
+
+Basic Usage:
+  AVEVA.NET.Document.Indexing.Gateway.exe -c "config.xml"
+
+Arguments:
+  -c "config.xml"        Configuration file (required)
+  -f "file.pdf"          Process single file or directory
+  -r "docname"           Output document name (override)
+  -d                     Delete staging files
+  -t "staging"           Alternative staging area
+  -s                     Silent mode (no message boxes)
+  -noReport              Don't create summary/report files
+  -context "A|B|C"       Override default context
+
+Examples:
+  # Process all files in configured source folder
+  gateway.exe -c "project.xml"
+  
+  # Process single file
+  gateway.exe -c "project.xml" -f "C:\\drawings\\PID-001.pdf"
+  
+  # Process with custom document name
+  gateway.exe -c "project.xml" -f "file.pdf" -r "CustomName"
+  
+  # Silent processing
+  gateway.exe -c "project.xml" -s -noReport
+
+Exit Codes:
+  0     Success
+  1     General failure
+  1001  License expired
+  1002  Insufficient license seats
+  1003  License missing
+  1004  Invalid license server"""
+
+# Starter pattern file written by "Create"
+PATTERN_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<Patterns version="5.0">
+    <!-- Equipment Tags: ###-X-##### -->
+    <Pattern from="\\d{3}-[A-Z]-\\d{5}" to="Equipment"/>
+    
+    <!-- Valve Tags: ###-HV-##### -->
+    <Pattern from="\\d{3}-HV-\\d{5}" to="Valve"/>
+    
+    <!-- Motor Tags: ###-EM-#####X-## -->
+    <Pattern from="\\d{3}-EM-\\d{5}[A-Z]-\\d{2}" to="Motor"/>
+    
+    <!-- Add your custom patterns here -->
+    
+</Patterns>"""
+
+ABOUT_TEXT = """Document Indexing Gateway
+Complete Edition with Advanced OCR
+
+Version: 5.0.11 + OCR Enhanced
+Release: January 2026
+
+Features:
+• Complete AVEVA NET specification compliance
+• Advanced OCR with intelligent preprocessing
+• Multi-pass OCR for complex P&IDs
+• Vertical and rotated text extraction
+• Monitor mode with real-time updates
+• File validation and fixing
+• Comprehensive error handling
+
+Python GUI Implementation"""
+
+# File/folder names the name tools treat as invalid: double spaces, leading/trailing whitespace
+INVALID_NAME_RE = re.compile(r'  |^\s|\s$')
+
+# Whitespace runs collapsed to one space when fixing names
+WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+# Number of invalid paths listed in the validation prompt
+INVALID_NAME_SAMPLES = 5
+
+# Concurrent renames in the name fixer (I/O bound, mostly waiting on the filesystem)
+RENAME_WORKERS = 32
+
+# Monitor polling interval when watchdog is not installed or cannot watch the folder (seconds)
+MONITOR_POLL_INTERVAL = 2
+
+# Full rescan interval of the event-driven monitor, catching files whose events were lost (seconds)
+MONITOR_RESCAN_INTERVAL = 60
+
+# Seconds a new file's size and mtime must stay unchanged before the monitor processes it
+MONITOR_SETTLE_TIME = 2
+
+
+def scan_tree(path):
+    """Yield os.DirEntry objects for everything below path (parents before children)"""
+    # OSErrors are ignored as os.walk does: unreadable folders are skipped,
+    # a listing that fails part-way stops there, and unknown types count as files
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    
+    with it:
+        while True:
+            try:
+                entry = next(it)
+            except (StopIteration, OSError):
+                return
+            
+            yield entry
+            
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                yield from scan_tree(entry.path)
+
+
+def write_json(file_path, data, indent=False):
+    """Write data as UTF-8 JSON (orjson when available, same bytes either way)"""
+    if ORJSON_AVAILABLE:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None)
+    elif indent:
+        raw = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        raw = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    
+    with open(file_path, 'wb') as f:
+        f.write(raw)
+
+
+def read_json(file_path):
+    """Read a JSON file (orjson when available)"""
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def file_signature(file_path):
+    """Return (size, mtime_ns) for a file, or None if it cannot be read"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def try_rename(paths):
+    """Rename (old_path, new_path); return None on success or the error text"""
+    old_path, new_path = paths
+    try:
+        os.rename(old_path, new_path)
+    except OSError as e:
+        return e.strerror or str(e)
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def read_config_file(file_path, mtime):
+    """Parse a configuration file (cached per path and modification time)"""
+    return read_json(file_path)
+
+
+if WATCHDOG_AVAILABLE:
+    class QueueingEventHandler(FileSystemEventHandler):
+        """Queue paths of files created, modified or moved into a watched folder"""
+        
+        def __init__(self, file_queue):
+            super().__init__()
+            self.file_queue = file_queue
+        
+        def on_created(self, event):
+            if not event.is_directory:
+                self.file_queue.put(event.src_path)
+        
+        def on_modified(self, event):
+            if not event.is_directory:
+                self.file_queue.put(event.src_path)
+        
+        def on_moved(self, event):
+            if not event.is_directory:
+                self.file_queue.put(event.dest_path)
 
 
 class AVEDACompleteGUI:
@@ -43,6 +508,12 @@ class AVEDACompleteGUI:
         # Window configuration
         self.setup_window()
         
+        # Import the gateway module while the UI is being built
+        self.gateway_module = None
+        self.gateway_error = None
+        self._gateway_loaded = threading.Event()
+        threading.Thread(target=self._load_gateway, daemon=True).start()
+        
         # Variables
         self.setup_variables()
         
@@ -50,16 +521,24 @@ class AVEDACompleteGUI:
         self.setup_styles()
         self.create_menu()
         self.create_ui()
+        self._update_gateway_warning_label()
+        
+        # Show the window once it is fully laid out
+        self.root.deiconify()
         
         # Monitor thread
         self.monitor_thread = None
         self.monitor_running = False
         
         # Load last config
+        self._last_config_path = Path.home() / ".aveva_gateway_last_config.json"
         self.load_last_config()
     
     def setup_window(self):
-        """Configure main window"""
+        """Configure main window (kept hidden until the UI is built)"""
+        global _dpi_initialized
+        self.root.withdraw()
+        
         width = 1100
         height = 750
         
@@ -72,114 +551,74 @@ class AVEDACompleteGUI:
         self.root.geometry(f"{width}x{height}+{x}+{y}")
         self.root.minsize(1000, 700)
         
-        # DPI awareness
-        try:
+        # DPI awareness (Windows only, once per process)
+        if not _dpi_initialized and sys.platform == 'win32':
             from ctypes import windll
-            windll.shcore.SetProcessDpiAwareness(2)
-        except:
             try:
-                from ctypes import windll
+                windll.shcore.SetProcessDpiAwareness(2)
+            except (AttributeError, OSError):
                 windll.user32.SetProcessDPIAware()
-            except:
-                pass
+        _dpi_initialized = True
+    
+    def _load_gateway(self):
+        """Import the gateway module (runs in a background thread, no Tk calls)"""
+        global GATEWAY_AVAILABLE
+        try:
+            self.gateway_module = importlib.import_module('document_indexing_gateway_complete')
+            GATEWAY_AVAILABLE = True
+        except Exception as e:
+            # Not only ImportError: a failing import (e.g. a missing optional
+            # dependency) would otherwise die silently under pythonw
+            self.gateway_error = f"{type(e).__name__}: {e}"
+            GATEWAY_AVAILABLE = False
+        finally:
+            self._gateway_loaded.set()
+    
+    def _wait_for_gateway(self) -> bool:
+        """Wait for the background import to finish and report availability"""
+        self._gateway_loaded.wait()
+        return bool(GATEWAY_AVAILABLE)
     
     def setup_variables(self):
         """Initialize all variables"""
-        # Project
-        self.project_name = tk.StringVar(value="My P&ID Project")
-        self.config_location = tk.StringVar()
-        
-        # Folders
-        self.source_folder = tk.StringVar()
-        self.destination_folder = tk.StringVar()
-        self.staging_area = tk.StringVar()
-        self.processed_folder = tk.StringVar()
-        self.unprocessed_folder = tk.StringVar()
-        self.log_folder = tk.StringVar()
-        
-        # AVEVA Standard Options
-        self.include_subfolders = tk.BooleanVar(value=True)
-        self.copy_source_files = tk.BooleanVar(value=True)
-        self.copy_other_files = tk.BooleanVar(value=False)
-        self.move_processed = tk.BooleanVar(value=True)
-        self.search_filenames_for_tags = tk.BooleanVar(value=False)
-        self.create_trigger_file = tk.BooleanVar(value=True)
-        self.insert_line_breaks = tk.BooleanVar(value=True)
-        self.object_id_from_vnet = tk.BooleanVar(value=False)
-        
-        # Pattern mapping
-        self.pattern_file = tk.StringVar()
-        self.default_context = tk.StringVar(value="Plant|Process Area")
-        
-        # Spreadsheet settings
-        self.use_ranges = tk.BooleanVar(value=False)
-        self.document_type = tk.StringVar(value="xlsx")
-        
-        # Timeouts
-        self.open_file_timeout_enabled = tk.BooleanVar(value=True)
-        self.open_file_timeout = tk.IntVar(value=30)
-        self.processing_timeout_enabled = tk.BooleanVar(value=False)
-        self.processing_timeout = tk.DoubleVar(value=60.0)
-        self.als_retry_timeout = tk.IntVar(value=120)
+        for name, var_type, default in VAR_SPEC:
+            setattr(self, name, var_type(value=default))
         
-        # Conversion
-        self.convert_doc = tk.BooleanVar(value=False)
-        self.convert_xls = tk.BooleanVar(value=False)
-        
-        # OCR settings
-        self.use_ocr = tk.BooleanVar(value=True)
-        self.ocr_language = tk.StringVar(value="eng")
-        self.ocr_dpi = tk.IntVar(value=300)
-        self.extract_vertical_text = tk.BooleanVar(value=True)
-        self.rotate_for_ocr = tk.BooleanVar(value=True)
-        
-        # Advanced OCR
-        self.adaptive_dpi = tk.BooleanVar(value=True)
-        self.dpi_min = tk.IntVar(value=300)
-        self.dpi_max = tk.IntVar(value=500)
-        self.preprocess_images = tk.BooleanVar(value=True)
-        self.enhance_contrast = tk.DoubleVar(value=1.5)
-        self.enhance_sharpness = tk.DoubleVar(value=1.5)
-        self.denoise = tk.BooleanVar(value=True)
-        self.use_multi_pass_ocr = tk.BooleanVar(value=True)
-        self.detect_regions = tk.BooleanVar(value=True)
-        self.min_text_confidence = tk.IntVar(value=60)
-        self.save_debug_images = tk.BooleanVar(value=False)
-        
-        # Processing mode
-        self.processing_mode = tk.StringVar(value="balanced")
+        # OCR controls register themselves here as their tab is built
+        self._ocr_dependent_widgets = []
+        self.use_ocr.trace_add('write', self.toggle_ocr)
         
         # Status
         self.status_text = tk.StringVar(value="Ready")
         self.is_processing = False
+        self.name_tool_running = False
     
     def setup_styles(self):
         """Configure UI styles"""
+        global _theme
         style = ttk.Style()
         
-        try:
-            style.theme_use('vista')
-        except:
-            try:
-                style.theme_use('clam')
-            except:
-                pass
+        # Resolve the theme once per process
+        if _theme is None:
+            available = style.theme_names()
+            _theme = next((t for t in PREFERRED_THEMES if t in available), '')
         
-        # Configure styles
-        style.configure('TFrame', background='#ffffff')
-        style.configure('Header.TFrame', background='#f0f0f0')
+        if _theme:
+            style.theme_use(_theme)
         
-        style.configure('TLabel', background='#ffffff', font=('Segoe UI', 9))
-        style.configure('Header.TLabel', background='#f0f0f0', font=('Segoe UI', 9))
-        style.configure('Title.TLabel', font=('Segoe UI', 11, 'bold'))
-        style.configure('Section.TLabel', font=('Segoe UI', 9, 'bold'))
+        # Fonts
+        existing = tkfont.names(self.root)
+        self.F_BASE, self.F_BOLD, self.F_TITLE = (
+            tkfont.Font(self.root, name=name, exists=name in existing, **options)
+            for name, options in FONT_SPEC
+        )
         
-        style.configure('TButton', font=('Segoe UI', 9))
-        style.configure('Action.TButton', font=('Segoe UI', 9, 'bold'))
+        # Configure styles
+        for name, options in STYLE_TABLE:
+            style.configure(name, **options)
         
-        style.configure('TCheckbutton', background='#ffffff', font=('Segoe UI', 9))
-        style.configure('TLabelframe', background='#ffffff', font=('Segoe UI', 9))
-        style.configure('TLabelframe.Label', background='#ffffff', font=('Segoe UI', 9, 'bold'))
+        for name, state_map in STYLE_MAP:
+            style.map(name, **state_map)
     
     def create_menu(self):
         """Create menu bar"""
@@ -210,7 +649,7 @@ class AVEDACompleteGUI:
         help_menu.add_command(label="About", command=self.show_about)
         
         # Keyboard bindings
-        self.root.bind('<Control-s>', lambda e: self.save_config())
+        self.root.bind('<Control-s>', self.save_config)
     
     def create_ui(self):
         """Create main UI"""
@@ -246,10 +685,17 @@ class AVEDACompleteGUI:
                            style='Header.TLabel', foreground='#0066cc')
         version.pack(side=tk.LEFT, padx=(10, 0))
         
-        if not GATEWAY_AVAILABLE:
-            warning = ttk.Label(header, text="⚠ Gateway module not found", 
-                              foreground='#e74c3c', style='Header.TLabel')
-            warning.pack(side=tk.RIGHT)
+        # Filled in once the gateway import has finished
+        self.gateway_warning = ttk.Label(header, text="", 
+                                         foreground='#e74c3c', style='Header.TLabel')
+        self.gateway_warning.pack(side=tk.RIGHT)
+    
+    def _update_gateway_warning_label(self):
+        """Show the header warning if the gateway module failed to import (polls until loaded)"""
+        if not self._gateway_loaded.is_set():
+            self.root.after(100, self._update_gateway_warning_label)
+        elif not GATEWAY_AVAILABLE:
+            self.gateway_warning.config(text="⚠ Gateway module not available")
     
     def create_project_section(self, parent):
         """Create project section"""
@@ -267,74 +713,131 @@ class AVEDACompleteGUI:
         ttk.Entry(name_frame, textvariable=self.config_location, width=50, state='readonly').pack(side=tk.LEFT, fill=tk.X, expand=True)
     
     def create_tabs(self, parent):
-        """Create tabbed interface"""
-        notebook = ttk.Notebook(parent)
-        notebook.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
-        
-        # Create tabs
-        self.create_locations_tab(notebook)
-        self.create_settings_tab(notebook)
-        self.create_ocr_basic_tab(notebook)
-        self.create_ocr_advanced_tab(notebook)
-        self.create_patterns_tab(notebook)
-        self.create_advanced_tab(notebook)
-    
-    def create_locations_tab(self, notebook):
+        """Create tabbed interface (tab contents are built on first selection)"""
+        self.notebook = ttk.Notebook(parent)
+        self.notebook.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        
+        # Tab builders, keyed by tab label
+        self._tab_builders = {
+            "📁 Locations": self.create_locations_tab,
+            "⚙️ Settings": self.create_settings_tab,
+            "🔍 OCR Basic": self.create_ocr_basic_tab,
+            "⚡ OCR Advanced": self.create_ocr_advanced_tab,
+            "🎯 Pattern Mapping": self.create_patterns_tab,
+            "🔧 Advanced": self.create_advanced_tab,
+        }
+        
+        # Placeholder frames
+        for label in self._tab_builders:
+            self.notebook.add(ttk.Frame(self.notebook, padding=15), text=label)
+        
+        self._tab_binding = self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+        self.on_tab_changed()
+    
+    def on_tab_changed(self, event=None):
+        """Build the selected tab the first time it is shown"""
+        frame = self.notebook.nametowidget(self.notebook.select())
+        builder = self._tab_builders.pop(self.notebook.tab(frame, 'text'), None)
+        if builder is None:
+            return
+        
+        builder(frame)
+        
+        # All tabs built - no need to keep listening
+        if not self._tab_builders:
+            self.notebook.unbind('<<NotebookTabChanged>>', self._tab_binding)
+    
+    def create_locations_tab(self, frame):
         """Locations tab"""
-        frame = ttk.Frame(notebook, padding=15)
-        notebook.add(frame, text="📁 Locations")
+        frame.columnconfigure(2, weight=1)
         
         # Include subfolders
         ttk.Checkbutton(frame, text="Include subfolders", 
-                       variable=self.include_subfolders).pack(anchor='w', pady=(0, 10))
+                       variable=self.include_subfolders).grid(row=0, column=0, columnspan=4, 
+                                                              sticky='w', pady=(0, 10))
         
         # Folder configurations
-        folders = [
-            ("Source Folder:", self.source_folder, True),
-            ("Destination Folder:", self.destination_folder, False),
-            ("Staging Area:", self.staging_area, True),
-            ("Processed Folder:", self.processed_folder, False),
-            ("Unprocessed Folder:", self.unprocessed_folder, False),
-            ("Log Folder:", self.log_folder, False),
-        ]
-        
-        for label, var, required in folders:
-            self.create_folder_row(frame, label, var, required)
+        for row, (label, attr, required) in enumerate(FOLDER_SPEC, start=1):
+            self.create_folder_row(frame, row, label, getattr(self, attr), required)
     
-    def create_folder_row(self, parent, label_text, variable, required):
-        """Create folder selection row"""
-        row = ttk.Frame(parent)
-        row.pack(fill=tk.X, pady=3)
-        
-        label_frame = ttk.Frame(row)
-        label_frame.pack(side=tk.LEFT)
-        
-        ttk.Label(label_frame, text=label_text, width=20, anchor='w').pack(side=tk.LEFT)
+    def create_folder_row(self, parent, row, label_text, variable, required):
+        """Create folder selection row (grid columns: label, *, entry, button)"""
+        ttk.Label(parent, text=label_text, width=20, anchor='w').grid(row=row, column=0, sticky='w', pady=3)
         
         if required:
-            ttk.Label(label_frame, text="*", foreground='red').pack(side=tk.LEFT)
+            ttk.Label(parent, text="*", foreground='red').grid(row=row, column=1, sticky='w')
         
-        ttk.Entry(row, textvariable=variable, width=60).pack(side=tk.LEFT, padx=(5, 0), fill=tk.X, expand=True)
-        ttk.Button(row, text="Browse", width=8, 
-                  command=lambda: self.browse_folder(variable)).pack(side=tk.LEFT, padx=(5, 0))
+        ttk.Entry(parent, textvariable=variable, width=60).grid(row=row, column=2, sticky='ew', padx=(5, 0))
+        ttk.Button(parent, text="Browse", width=8, 
+                  command=functools.partial(self.browse_folder, variable)).grid(row=row, column=3, padx=(5, 0))
     
-    def create_settings_tab(self, notebook):
-        """Settings tab - AVEVA standard options"""
-        frame = ttk.Frame(notebook, padding=15)
-        notebook.add(frame, text="⚙️ Settings")
+    def create_checkbuttons(self, parent, specs, pady=2):
+        """Create a column of checkbuttons from (text, attribute) pairs"""
+        checks = []
+        for text, attr in specs:
+            check = ttk.Checkbutton(parent, text=text, variable=getattr(self, attr))
+            check.pack(anchor='w', pady=pady)
+            checks.append(check)
+        return checks
+    
+    def create_scroll_content(self, frame):
+        """Create a content frame for a tab that may need scrolling (see show_scrollable)"""
+        viewport = ttk.Frame(frame)
+        viewport.pack(fill=tk.BOTH, expand=True)
+        return ttk.Frame(viewport)
+    
+    def show_scrollable(self, content):
+        """Show content, wrapping it in a scrolling canvas once it overflows the tab"""
+        viewport = content.master
+        self.root.update_idletasks()
+        if content.winfo_reqheight() > viewport.winfo_height():
+            self.add_scroll_canvas(content)
+            return
         
-        # Create scrollable frame
-        canvas = tk.Canvas(frame, bg='white', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scroll_frame = ttk.Frame(canvas)
+        content.pack(fill=tk.BOTH, expand=True)
         
-        scroll_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
+        # Re-check whenever the tab is resized (e.g. the window is made smaller)
+        content._overflow_binding = viewport.bind(
+            "<Configure>", functools.partial(self.check_overflow, content))
+    
+    def check_overflow(self, content, event):
+        """Move packed content into a scrolling canvas if the tab became too small for it"""
+        if content.winfo_reqheight() <= event.height:
+            return
+        
+        content.master.unbind("<Configure>", content._overflow_binding)
+        content.pack_forget()
+        self.add_scroll_canvas(content)
+    
+    def add_scroll_canvas(self, content):
+        """Show content inside a scrolling canvas filling its viewport"""
+        viewport = content.master
+        
+        # Canvas is only a viewport: match the frame background, no border/focus ring
+        canvas = tk.Canvas(viewport, bg=ttk.Style().lookup('TFrame', 'background'), 
+                           bd=0, highlightthickness=0, takefocus=0)
+        scrollbar = ttk.Scrollbar(viewport, orient="vertical", command=canvas.yview)
+        
+        canvas._last_size = None
+        canvas._scroll_job = None
+        content.bind("<Configure>", functools.partial(self.schedule_scrollregion, canvas))
+        item = canvas.create_window((0, 0), window=content, anchor="nw")
+        
+        # Stretch content to the canvas width, as fill=BOTH does when it is packed
+        canvas.bind("<Configure>", functools.partial(self.fit_canvas_width, canvas, item))
         canvas.configure(yscrollcommand=scrollbar.set)
         
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        # content was created before the canvas, raise it above (the viewport clips it)
+        content.lift(canvas)
+    
+    def create_settings_tab(self, frame):
+        """Settings tab - AVEVA standard options"""
+        # Content frame (placed by show_scrollable once built)
+        scroll_frame = self.create_scroll_content(frame)
+        
         # Spreadsheet Format
         spread_frame = ttk.LabelFrame(scroll_frame, text="Spreadsheet Format", padding=10)
         spread_frame.pack(fill=tk.X, pady=(0, 10))
@@ -351,18 +854,7 @@ class AVEDACompleteGUI:
         options_frame = ttk.LabelFrame(scroll_frame, text="File Handling Options", padding=10)
         options_frame.pack(fill=tk.X, pady=(0, 10))
         
-        options = [
-            ("Copy Source Files to Staging Area", self.copy_source_files),
-            ("Copy Other Files to Staging Area", self.copy_other_files),
-            ("Search File Names for Tags", self.search_filenames_for_tags),
-            ("Create Trigger File (trigger.start)", self.create_trigger_file),
-            ("Move Processed and Unprocessed Files", self.move_processed),
-            ("Insert Line Breaks", self.insert_line_breaks),
-            ("Object ID from VNet File", self.object_id_from_vnet),
-        ]
-        
-        for text, var in options:
-            ttk.Checkbutton(options_frame, text=text, variable=var).pack(anchor='w', pady=2)
+        self.create_checkbuttons(options_frame, FILE_OPTIONS)
         
         # Time Outs
         timeout_frame = ttk.LabelFrame(scroll_frame, text="Time Outs", padding=10)
@@ -395,22 +887,18 @@ class AVEDACompleteGUI:
         conv_frame = ttk.LabelFrame(scroll_frame, text="File Conversion", padding=10)
         conv_frame.pack(fill=tk.X)
         
-        ttk.Checkbutton(conv_frame, text="Convert .doc Source Files to .docx before processing", 
-                       variable=self.convert_doc).pack(anchor='w', pady=2)
-        ttk.Checkbutton(conv_frame, text="Convert .xls Source Files to .xlsx before processing", 
-                       variable=self.convert_xls).pack(anchor='w', pady=2)
+        self.create_checkbuttons(conv_frame, CONVERSION_OPTIONS)
+        
+        self.show_scrollable(scroll_frame)
     
-    def create_ocr_basic_tab(self, notebook):
+    def create_ocr_basic_tab(self, frame):
         """OCR Basic tab"""
-        frame = ttk.Frame(notebook, padding=15)
-        notebook.add(frame, text="🔍 OCR Basic")
-        
         # Enable OCR
         enable_frame = ttk.Frame(frame)
         enable_frame.pack(fill=tk.X, pady=(0, 15))
         
         chk = ttk.Checkbutton(enable_frame, text="Enable OCR (Optical Character Recognition)", 
-                             variable=self.use_ocr, command=self.toggle_ocr)
+                             variable=self.use_ocr)
         chk.pack(anchor='w')
         
         self.ocr_basic_frame = ttk.Frame(frame)
@@ -424,62 +912,39 @@ class AVEDACompleteGUI:
         lang_row = ttk.Frame(settings_frame)
         lang_row.pack(fill=tk.X, pady=3)
         ttk.Label(lang_row, text="Language:", width=20).pack(side=tk.LEFT)
-        ttk.Combobox(lang_row, textvariable=self.ocr_language, 
-                    values=['eng', 'fra', 'deu', 'spa', 'ita'], width=15).pack(side=tk.LEFT)
+        lang_combo = ttk.Combobox(lang_row, textvariable=self.ocr_language, 
+                                  values=['eng', 'fra', 'deu', 'spa', 'ita'], width=15)
+        lang_combo.pack(side=tk.LEFT)
         
         # Base DPI
         dpi_row = ttk.Frame(settings_frame)
         dpi_row.pack(fill=tk.X, pady=3)
         ttk.Label(dpi_row, text="Base DPI:", width=20).pack(side=tk.LEFT)
-        ttk.Spinbox(dpi_row, textvariable=self.ocr_dpi, from_=200, to=600, 
-                   increment=50, width=15).pack(side=tk.LEFT)
+        dpi_spin = ttk.Spinbox(dpi_row, textvariable=self.ocr_dpi, from_=200, to=600, 
+                               increment=50, width=15)
+        dpi_spin.pack(side=tk.LEFT)
         
         # Options
         options_frame = ttk.LabelFrame(self.ocr_basic_frame, text="Text Extraction Options", padding=10)
         options_frame.pack(fill=tk.X)
         
-        ttk.Checkbutton(options_frame, text="Extract Vertical Text (rotated tags)", 
-                       variable=self.extract_vertical_text).pack(anchor='w', pady=2)
-        ttk.Checkbutton(options_frame, text="Rotate for OCR (multiple angles: 0°, 90°, 180°, 270°)", 
-                       variable=self.rotate_for_ocr).pack(anchor='w', pady=2)
+        checks = self.create_checkbuttons(options_frame, OCR_TEXT_OPTIONS)
         
         # Info
         info_frame = ttk.Frame(self.ocr_basic_frame, padding=10)
         info_frame.pack(fill=tk.BOTH, expand=True, pady=(10, 0))
         
-        info = tk.Text(info_frame, wrap=tk.WORD, height=10, font=('Segoe UI', 9), bg='#f8f8f8')
-        info.pack(fill=tk.BOTH, expand=True)
-        
-        info_text = """📋 Basic OCR Settings Guide:
-
-Language: Select OCR language (eng = English)
-Base DPI: Image resolution (300 = standard, 400-600 = better quality for small text)
-
-Extract Vertical Text: Detects tags rotated 90° (common in P&IDs)
-Rotate for OCR: Tries multiple angles to capture text at any orientation
-
-💡 For complex P&IDs with small text, tables, or mixed orientations:
-   Enable "OCR Advanced" tab for intelligent multi-pass processing"""
+        ttk.Label(info_frame, text=OCR_BASIC_HELP, wraplength=800, justify=tk.LEFT, anchor='nw',
+                 font=FONT_BASE, background='#f8f8f8', padding=5).pack(fill=tk.BOTH, expand=True)
         
-        info.insert('1.0', info_text)
-        info.config(state='disabled')
+        # Follow the Enable OCR setting
+        self._ocr_dependent_widgets.extend([lang_combo, dpi_spin, *checks])
+        self.toggle_ocr()
     
-    def create_ocr_advanced_tab(self, notebook):
+    def create_ocr_advanced_tab(self, frame):
         """OCR Advanced tab"""
-        frame = ttk.Frame(notebook, padding=15)
-        notebook.add(frame, text="⚡ OCR Advanced")
-        
-        # Create scrollable frame
-        canvas = tk.Canvas(frame, bg='white', highlightthickness=0)
-        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
-        scroll_frame = ttk.Frame(canvas)
-        
-        scroll_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Content frame (placed by show_scrollable once built)
+        scroll_frame = self.create_scroll_content(frame)
         
         # Processing mode
         mode_frame = ttk.LabelFrame(scroll_frame, text="Processing Mode Presets", padding=10)
@@ -537,10 +1002,7 @@ Rotate for OCR: Tries multiple angles to capture text at any orientation
         advanced_frame = ttk.LabelFrame(scroll_frame, text="Advanced OCR Features", padding=10)
         advanced_frame.pack(fill=tk.X, pady=(0, 10))
         
-        ttk.Checkbutton(advanced_frame, text="Multi-Pass OCR (4-8 passes per region for maximum accuracy)", 
-                       variable=self.use_multi_pass_ocr).pack(anchor='w', pady=2)
-        ttk.Checkbutton(advanced_frame, text="Smart Region Detection (title block, table, equipment zones)", 
-                       variable=self.detect_regions).pack(anchor='w', pady=2)
+        self.create_checkbuttons(advanced_frame, OCR_ADVANCED_OPTIONS)
         
         # Quality Control
         quality_frame = ttk.LabelFrame(scroll_frame, text="Quality Control", padding=10)
@@ -560,12 +1022,11 @@ Rotate for OCR: Tries multiple angles to capture text at any orientation
         
         ttk.Checkbutton(debug_frame, text="Save Debug Images (intermediate processing steps)", 
                        variable=self.save_debug_images).pack(anchor='w')
+        
+        self.show_scrollable(scroll_frame)
     
-    def create_patterns_tab(self, notebook):
+    def create_patterns_tab(self, frame):
         """Patterns tab"""
-        frame = ttk.Frame(notebook, padding=15)
-        notebook.add(frame, text="🎯 Pattern Mapping")
-        
         # Pattern file
         file_frame = ttk.LabelFrame(frame, text="Pattern Mapping File (XML)", padding=10)
         file_frame.pack(fill=tk.X, pady=(0, 10))
@@ -589,117 +1050,30 @@ Rotate for OCR: Tries multiple angles to capture text at any orientation
         info_frame = ttk.Frame(frame)
         info_frame.pack(fill=tk.BOTH, expand=True)
         
-        info = scrolledtext.ScrolledText(info_frame, wrap=tk.WORD, font=('Consolas', 9), bg='#f8f8f8')
+        info = scrolledtext.ScrolledText(info_frame, wrap=tk.WORD, font=('Consolas', 9), bg='#f8f8f8',
+                                         undo=False, autoseparators=False, maxundo=0)
         info.pack(fill=tk.BOTH, expand=True)
         
-        info_text = """📋 Pattern Mapping Guide (AVEVA NET Standard):
-
-Pattern mapping uses regular expressions to identify and classify tags in documents.
-
-Example Pattern File (XML):
-─────────────────────────────────────────────────────────────────
-<?xml version="1.0" encoding="UTF-8"?>
-<Patterns version="5.0">
-  <!-- Equipment Tags: ###-X-##### -->
-  <Pattern from="\\d{3}-[A-Z]-\\d{5}" to="Equipment"/>
-  
-  <!-- Valve Tags: ###-HV-##### -->
-  <Pattern from="\\d{3}-HV-\\d{5}" to="Valve"/>
-  
-  <!-- Complex Pipeline: ###-XX-#####-##"-XXXXXXX-XX-### -->
-  <Pattern from="\\d{3}-[A-Z]{2}-\\d{5}-\\d{1,2}\\"-[A-Z0-9]{6,8}-[A-Z]{2}-\\d{3}" 
-           to="PipeLine"/>
-  
-  <!-- Motor Tags with Expansion -->
-  <Pattern from="\\d{3}-EM-\\d{5}[A-Z]-[A-Z]" to="Motor">
-    <Expand Interpolate="true">
-      <SubPattern>[A-Z]-[A-Z]</SubPattern>
-      <Char>-</Char>
-    </Expand>
-  </Pattern>
-  
-  <!-- Tag with Replacement -->
-  <Pattern from="[A-Z]-\\d{3}" to="Valve">
-    <Replace>
-      <Original>[A-Z]-</Original>
-      <Replacement>[A-Z]</Replacement>
-    </Replace>
-  </Pattern>
-</Patterns>
-─────────────────────────────────────────────────────────────────
-
-Supported Features:
-• Regular expression patterns (from="...")
-• Classification (to="...")
-• Context override (context="...")
-• Tag expansion with interpolation
-• String replacement
-• String insertion
-• Exclusion patterns
-
-For your P&ID project, use the provided 'pattern_mapping_precise.xml' file."""
-        
-        info.insert('1.0', info_text)
+        info.insert('1.0', PATTERNS_HELP)
         info.config(state='disabled')
     
-    def create_advanced_tab(self, notebook):
+    def create_advanced_tab(self, frame):
         """Advanced settings tab"""
-        frame = ttk.Frame(notebook, padding=15)
-        notebook.add(frame, text="🔧 Advanced")
-        
         # File types
         types_frame = ttk.LabelFrame(frame, text="Supported File Types", padding=10)
         types_frame.pack(fill=tk.X, pady=(0, 10))
         
-        types_text = """Supported formats: PDF, DOC, DOCX, XLS, XLSX, PPT, PPTX, TXT, ZIP, RTF, DWG
-Configure additional file types in the configuration XML file."""
-        
-        ttk.Label(types_frame, text=types_text, foreground='#666').pack(anchor='w')
+        ttk.Label(types_frame, text=FILE_TYPES_HELP, foreground='#666').pack(anchor='w')
         
         # Command line
         cmd_frame = ttk.LabelFrame(frame, text="Command Line Usage", padding=10)
         cmd_frame.pack(fill=tk.BOTH, expand=True)
         
-        cmd_text = scrolledtext.ScrolledText(cmd_frame, wrap=tk.WORD, font=('Consolas', 8), bg='#f8f8f8', height=15)
+        cmd_text = scrolledtext.ScrolledText(cmd_frame, wrap=tk.WORD, font=('Consolas', 8), bg='#f8f8f8', height=15,
+                                             undo=False, autoseparators=False, maxundo=0)
         cmd_text.pack(fill=tk.BOTH, expand=True)
         
-        cmd_info = """Command Line Arguments (AVEVA NET Standard):
-
-Basic Usage:
-  AVEVA.NET.Document.Indexing.Gateway.exe -c "config.xml"
-
-Arguments:
-  -c "config.xml"        Configuration file (required)
-  -f "file.pdf"          Process single file or directory
-  -r "docname"           Output document name (override)
-  -d                     Delete staging files
-  -t "staging"           Alternative staging area
-  -s                     Silent mode (no message boxes)
-  -noReport              Don't create summary/report files
-  -context "A|B|C"       Override default context
-
-Examples:
-  # Process all files in configured source folder
-  gateway.exe -c "project.xml"
-  
-  # Process single file
-  gateway.exe -c "project.xml" -f "C:\\drawings\\PID-001.pdf"
-  
-  # Process with custom document name
-  gateway.exe -c "project.xml" -f "file.pdf" -r "CustomName"
-  
-  # Silent processing
-  gateway.exe -c "project.xml" -s -noReport
-
-Exit Codes:
-  0     Success
-  1     General failure
-  1001  License expired
-  1002  Insufficient license seats
-  1003  License missing
-  1004  Invalid license server"""
-        
-        cmd_text.insert('1.0', cmd_info)
+        cmd_text.insert('1.0', CMD_HELP)
         cmd_text.config(state='disabled')
     
     def create_controls(self, parent):
@@ -750,6 +1124,27 @@ Exit Codes:
     
     # Event handlers
     
+    def fit_canvas_width(self, canvas, item, event):
+        """Keep the scrolled content as wide as its canvas"""
+        canvas.itemconfigure(item, width=event.width)
+    
+    def schedule_scrollregion(self, canvas, event):
+        """Refresh the canvas scroll region after the inner frame is resized (debounced)"""
+        size = (event.width, event.height)
+        if size == canvas._last_size:
+            return
+        canvas._last_size = size
+        
+        # Collapse bursts of resize events into one update
+        if canvas._scroll_job:
+            canvas.after_cancel(canvas._scroll_job)
+        canvas._scroll_job = canvas.after(50, self.update_scrollregion, canvas)
+    
+    def update_scrollregion(self, canvas):
+        """Fit the canvas scroll region to its contents"""
+        canvas._scroll_job = None
+        canvas.configure(scrollregion=canvas.bbox("all"))
+    
     def browse_folder(self, variable):
         """Browse for folder"""
         folder = filedialog.askdirectory(title="Select Folder")
@@ -774,24 +1169,9 @@ Exit Codes:
         )
         
         if file:
-            template = """<?xml version="1.0" encoding="UTF-8"?>
-<Patterns version="5.0">
-    <!-- Equipment Tags: ###-X-##### -->
-    <Pattern from="\\d{3}-[A-Z]-\\d{5}" to="Equipment"/>
-    
-    <!-- Valve Tags: ###-HV-##### -->
-    <Pattern from="\\d{3}-HV-\\d{5}" to="Valve"/>
-    
-    <!-- Motor Tags: ###-EM-#####X-## -->
-    <Pattern from="\\d{3}-EM-\\d{5}[A-Z]-\\d{2}" to="Motor"/>
-    
-    <!-- Add your custom patterns here -->
-    
-</Patterns>"""
-            
             try:
                 with open(file, 'w') as f:
-                    f.write(template)
+                    f.write(PATTERN_TEMPLATE)
                 self.pattern_file.set(file)
                 messagebox.showinfo("Success", "Pattern file created successfully!")
             except Exception as e:
@@ -808,68 +1188,84 @@ Exit Codes:
             if sys.platform == 'win32':
                 os.startfile(file)
             else:
+                import subprocess
                 subprocess.call(['xdg-open', file])
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open pattern file:\n{e}")
     
-    def toggle_ocr(self):
-        """Toggle OCR controls"""
-        state = 'normal' if self.use_ocr.get() else 'disabled'
-        for child in self.ocr_basic_frame.winfo_children():
-            self.set_state_recursive(child, state)
+    def toggle_ocr(self, *args):
+        """Enable/disable OCR controls (trace callback on use_ocr)"""
+        state = '!disabled' if self.use_ocr.get() else 'disabled'
+        self.set_state_all(self._ocr_dependent_widgets, state)
     
-    def set_state_recursive(self, widget, state):
-        """Set state recursively"""
-        try:
-            widget.configure(state=state)
-        except:
-            pass
-        
-        for child in widget.winfo_children():
-            self.set_state_recursive(child, state)
+    def set_state_all(self, widgets, state):
+        """Set a ttk state flag (e.g. 'disabled', '!disabled') on several widgets in one Tcl call"""
+        if widgets:
+            # apply gives the loop its own scope, so no Tcl globals are created
+            self.root.tk.call('apply', '{ws s} {foreach w $ws {$w state $s}}', 
+                              tuple(str(w) for w in widgets), state)
     
     def apply_processing_mode(self):
         """Apply processing mode preset"""
-        mode = self.processing_mode.get()
-        
-        if mode == "fast":
-            self.adaptive_dpi.set(False)
-            self.preprocess_images.set(False)
-            self.use_multi_pass_ocr.set(False)
-            self.detect_regions.set(False)
-        elif mode == "balanced":
-            self.adaptive_dpi.set(True)
-            self.dpi_max.set(500)
-            self.preprocess_images.set(True)
-            self.use_multi_pass_ocr.set(True)
-            self.detect_regions.set(True)
-        elif mode == "high_quality":
-            self.adaptive_dpi.set(True)
-            self.dpi_max.set(600)
-            self.preprocess_images.set(True)
-            self.enhance_contrast.set(2.0)
-            self.enhance_sharpness.set(2.0)
-            self.denoise.set(True)
-            self.use_multi_pass_ocr.set(True)
-            self.detect_regions.set(True)
+        for name, value in MODE_PRESETS.get(self.processing_mode.get(), {}).items():
+            getattr(self, name).set(value)
     
     def validate_file_names(self):
         """Validate file names (AVEVA feature)"""
-        if not self.source_folder.get():
+        source_folder = self.source_folder.get()
+        if not source_folder:
             messagebox.showwarning("Warning", "Please select a source folder first.")
             return
         
-        # Scan for invalid file names
-        invalid_files = []
-        for root, dirs, files in os.walk(self.source_folder.get()):
-            for name in files + dirs:
-                # Check for invalid patterns (double spaces, etc.)
-                if '  ' in name or name != name.strip():
-                    invalid_files.append(os.path.join(root, name))
+        self.start_name_tool(self.validate_names_thread, source_folder, "Validating file names...")
+    
+    def start_name_tool(self, target, source_folder, status):
+        """Run a file name tool thread (one at a time, never while processing)"""
+        if self.name_tool_running or self.is_processing:
+            messagebox.showwarning("Warning", "Please wait for the current operation to finish.")
+            return
+        
+        self.name_tool_running = True
+        self.progress.start(10)
+        self.status_text.set(status)
+        
+        thread = threading.Thread(target=target, args=(source_folder,), daemon=True)
+        thread.start()
+    
+    def finish_name_tool(self, status):
+        """Release the name tools; leave progress/status alone while processing runs"""
+        self.name_tool_running = False
+        if not self.is_processing:
+            self.progress.stop()
+            self.status_text.set(status)
+    
+    def validate_names_thread(self, source_folder):
+        """File name validation thread"""
+        try:
+            # Scan for invalid file names (double spaces, etc.), keeping only a few examples
+            invalid_count = 0
+            sample = []
+            for entry in scan_tree(source_folder):
+                if INVALID_NAME_RE.search(entry.name):
+                    invalid_count += 1
+                    if len(sample) < INVALID_NAME_SAMPLES:
+                        sample.append(entry.path)
+            
+            self.root.after(0, self.validation_complete, invalid_count, sample)
         
-        if invalid_files:
+        except Exception as e:
+            self.root.after(0, self.name_tool_error, "Validation", str(e))
+    
+    def validation_complete(self, invalid_count, sample):
+        """File name validation completed"""
+        self.finish_name_tool(f"Validation complete: {invalid_count} invalid names")
+        
+        if invalid_count:
+            examples = "\n".join(sample)
+            more = "\n..." if invalid_count > len(sample) else ""
             result = messagebox.askyesno("Invalid File Names Found", 
-                                        f"Found {len(invalid_files)} invalid file/folder names.\n\n"
+                                        f"Found {invalid_count} invalid file/folder names.\n\n"
+                                        f"{examples}{more}\n\n"
                                         f"Do you want to fix them?")
             if result:
                 self.fix_file_names()
@@ -878,30 +1274,79 @@ Exit Codes:
     
     def fix_file_names(self):
         """Fix invalid file names (AVEVA feature)"""
-        if not self.source_folder.get():
+        source_folder = self.source_folder.get()
+        if not source_folder:
             messagebox.showwarning("Warning", "Please select a source folder first.")
             return
         
-        fixed_count = 0
-        for root, dirs, files in os.walk(self.source_folder.get()):
-            for name in files + dirs:
-                old_path = os.path.join(root, name)
+        self.start_name_tool(self.fix_names_thread, source_folder, "Fixing file names...")
+    
+    def fix_names_thread(self, source_folder):
+        """File name fixing thread"""
+        try:
+            # Pending renames grouped by depth; renames onto an existing name, or onto
+            # a name another entry already claimed, are refused (os.rename would overwrite)
+            levels = collections.defaultdict(list)
+            claimed = set()
+            clashes = []
+            for entry in scan_tree(source_folder):
                 # Fix double spaces
-                new_name = ' '.join(name.split())
-                new_name = new_name.strip()
+                new_name = WHITESPACE_RUN_RE.sub(' ', entry.name).strip()
                 
-                if new_name != name:
-                    new_path = os.path.join(root, new_name)
-                    try:
-                        os.rename(old_path, new_path)
-                        fixed_count += 1
-                    except:
-                        pass
+                if new_name != entry.name:
+                    # entry.path always ends with entry.name
+                    new_path = entry.path[:-len(entry.name)] + new_name
+                    key = os.path.normcase(new_path)
+                    if key in claimed or os.path.lexists(new_path):
+                        clashes.append(entry.path)
+                        continue
+                    claimed.add(key)
+                    levels[entry.path.count(os.sep)].append((entry.path, new_path))
+            
+            fixed_count = 0
+            failed_count = len(clashes)
+            failures = [f"{path}: fixed name clashes with another file or folder"
+                        for path in clashes[:INVALID_NAME_SAMPLES]]
+            with ThreadPoolExecutor(max_workers=RENAME_WORKERS) as executor:
+                # Deepest level first, so renaming a folder never invalidates pending paths
+                for depth in sorted(levels, reverse=True):
+                    renames = levels[depth]
+                    for (old_path, _), error in zip(renames, executor.map(try_rename, renames)):
+                        if error is None:
+                            fixed_count += 1
+                        else:
+                            failed_count += 1
+                            if len(failures) < INVALID_NAME_SAMPLES:
+                                failures.append(f"{old_path}: {error}")
+            
+            self.root.after(0, self.fix_complete, fixed_count, failed_count, failures)
         
-        messagebox.showinfo("Fix Complete", f"Fixed {fixed_count} file/folder names.")
+        except Exception as e:
+            self.root.after(0, self.name_tool_error, "Fix", str(e))
+    
+    def fix_complete(self, fixed_count, failed_count, failures):
+        """File name fixing completed"""
+        self.finish_name_tool(f"Fixed {fixed_count} file/folder names")
+        
+        if failed_count:
+            details = "\n".join(failures)
+            more = "\n..." if failed_count > len(failures) else ""
+            messagebox.showwarning("Fix Complete", 
+                                   f"Fixed {fixed_count} file/folder names.\n"
+                                   f"Failed to rename {failed_count}:\n\n"
+                                   f"{details}{more}")
+        else:
+            messagebox.showinfo("Fix Complete", f"Fixed {fixed_count} file/folder names.")
+    
+    def name_tool_error(self, action, error):
+        """File name validation/fixing error"""
+        self.finish_name_tool("Error occurred")
+        messagebox.showerror(f"{action} Error", f"File name {action.lower()} failed:\n\n{error}")
     
     def test_patterns(self):
         """Test pattern matching"""
+        import subprocess
+        
         pattern_file = self.pattern_file.get()
         
         if not pattern_file or not os.path.exists(pattern_file):
@@ -914,83 +1359,91 @@ Exit Codes:
             return
         
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 [sys.executable, str(test_script), pattern_file],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=30
+                bufsize=1
             )
-            
-            # Show results
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Pattern Test Results")
-            dialog.geometry("900x650")
-            
-            text = scrolledtext.ScrolledText(dialog, wrap=tk.WORD, font=('Consolas', 9))
-            text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-            
-            text.insert('1.0', result.stdout)
-            text.config(state='disabled')
-            
-            ttk.Button(dialog, text="Close", command=dialog.destroy).pack(pady=5)
-        
-        except subprocess.TimeoutExpired:
-            messagebox.showerror("Error", "Pattern test timed out.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to run pattern test:\n{e}")
+            return
+        
+        # Show results as they arrive
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Pattern Test Results")
+        dialog.geometry("900x650")
+        
+        text = scrolledtext.ScrolledText(dialog, wrap=tk.WORD, font=('Consolas', 9))
+        text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Closing the dialog also stops the test
+        close = functools.partial(self.close_pattern_test, dialog, proc)
+        dialog.protocol("WM_DELETE_WINDOW", close)
+        ttk.Button(dialog, text="Close", command=close).pack(pady=5)
+        
+        # Output is queued by the reader thread and appended in batches
+        output = queue.Queue()
+        threading.Thread(target=self.pattern_test_thread, args=(proc, output), daemon=True).start()
+        self.drain_pattern_test(text, output)
+    
+    def pattern_test_thread(self, proc, output):
+        """Queue pattern test output line by line (None marks the end)"""
+        timer = threading.Timer(30, proc.kill)
+        timer.daemon = True
+        timer.start()
+        try:
+            for line in proc.stdout:
+                output.put(line)
+            proc.wait()
+        except Exception as e:
+            proc.kill()
+            proc.wait()
+            output.put(f"\n✗ Failed to run pattern test:\n{e}\n")
+        finally:
+            timed_out = timer.finished.is_set()
+            timer.cancel()
+            proc.stdout.close()
+        
+        if timed_out:
+            output.put("\n✗ Pattern test timed out.\n")
+        output.put(None)
+    
+    def drain_pattern_test(self, text_widget, output):
+        """Append queued pattern test output, one insert per tick (Tk thread)"""
+        if not text_widget.winfo_exists():
+            return
+        
+        chunks = []
+        finished = False
+        try:
+            while True:
+                line = output.get_nowait()
+                if line is None:
+                    finished = True
+                    break
+                chunks.append(line)
+        except queue.Empty:
+            pass
+        
+        if chunks:
+            self.append_log(text_widget, ''.join(chunks))
+        
+        if finished:
+            text_widget.config(state='disabled')
+        else:
+            self.root.after(100, self.drain_pattern_test, text_widget, output)
+    
+    def close_pattern_test(self, dialog, proc):
+        """Close the pattern test dialog, killing the test if it is still running"""
+        if proc.poll() is None:
+            proc.kill()
+        dialog.destroy()
     
     def get_config(self) -> dict:
         """Get configuration dictionary"""
-        return {
-            "name": self.project_name.get(),
-            "source_folder": self.source_folder.get(),
-            "destination_folder": self.destination_folder.get(),
-            "staging_area": self.staging_area.get(),
-            "processed_folder": self.processed_folder.get(),
-            "unprocessed_folder": self.unprocessed_folder.get(),
-            "log_folder": self.log_folder.get(),
-            "pattern_mapping_file": self.pattern_file.get(),
-            "default_context": self.default_context.get(),
-            
-            "include_subfolders": self.include_subfolders.get(),
-            "copy_source_files": self.copy_source_files.get(),
-            "copy_other_files": self.copy_other_files.get(),
-            "move_processed": self.move_processed.get(),
-            "search_filenames_for_tags": self.search_filenames_for_tags.get(),
-            "create_trigger_file": self.create_trigger_file.get(),
-            "insert_line_breaks": self.insert_line_breaks.get(),
-            "object_id_from_vnet": self.object_id_from_vnet.get(),
-            
-            "use_ranges": self.use_ranges.get(),
-            "document_type": self.document_type.get(),
-            
-            "open_file_timeout_enabled": self.open_file_timeout_enabled.get(),
-            "open_file_timeout": self.open_file_timeout.get(),
-            "processing_timeout_enabled": self.processing_timeout_enabled.get(),
-            "processing_timeout": self.processing_timeout.get(),
-            "als_retry_timeout": self.als_retry_timeout.get(),
-            
-            "convert_doc": self.convert_doc.get(),
-            "convert_xls": self.convert_xls.get(),
-            
-            "use_ocr": self.use_ocr.get(),
-            "ocr_language": self.ocr_language.get(),
-            "ocr_dpi": self.ocr_dpi.get(),
-            "extract_vertical_text": self.extract_vertical_text.get(),
-            "rotate_for_ocr": self.rotate_for_ocr.get(),
-            
-            "adaptive_dpi": self.adaptive_dpi.get(),
-            "dpi_min": self.dpi_min.get(),
-            "dpi_max": self.dpi_max.get(),
-            "preprocess_images": self.preprocess_images.get(),
-            "enhance_contrast": self.enhance_contrast.get(),
-            "enhance_sharpness": self.enhance_sharpness.get(),
-            "denoise": self.denoise.get(),
-            "use_multi_pass_ocr": self.use_multi_pass_ocr.get(),
-            "detect_regions": self.detect_regions.get(),
-            "min_text_confidence": self.min_text_confidence.get(),
-            "save_debug_images": self.save_debug_images.get(),
-        }
+        return {key: getattr(self, attr).get() for key, attr in CONFIG_FIELDS}
     
     def new_config(self):
         """Create new configuration"""
@@ -1015,7 +1468,7 @@ Exit Codes:
         folder_var = tk.StringVar()
         ttk.Entry(folder_frame, textvariable=folder_var, width=45).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(folder_frame, text="Browse", width=8,
-                  command=lambda: folder_var.set(filedialog.askdirectory())).pack(side=tk.LEFT, padx=(5, 0))
+                  command=functools.partial(self.browse_folder, folder_var)).pack(side=tk.LEFT, padx=(5, 0))
         
         def create():
             if not name_var.get() or not folder_var.get():
@@ -1023,7 +1476,7 @@ Exit Codes:
                 return
             
             self.project_name.set(name_var.get())
-            config_file = os.path.join(folder_var.get(), f"{name_var.get()}.xml")
+            config_file = os.path.join(folder_var.get(), f"{name_var.get()}.json")
             self.config_location.set(config_file)
             
             # Create default config
@@ -1039,15 +1492,15 @@ Exit Codes:
         ttk.Button(btn_frame, text="Create", command=create, width=12).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Cancel", command=dialog.destroy, width=12).pack(side=tk.LEFT, padx=5)
     
-    def save_config(self):
+    def save_config(self, event=None):
         """Save configuration"""
         config_file = self.config_location.get()
         
         if not config_file:
             config_file = filedialog.asksaveasfilename(
                 title="Save Configuration",
-                defaultextension=".xml",
-                filetypes=[("XML Files", "*.xml"), ("All Files", "*.*")]
+                defaultextension=".json",
+                filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")]
             )
         
         if config_file:
@@ -1058,16 +1511,13 @@ Exit Codes:
         try:
             config = self.get_config()
             
-            # Convert to XML format (simplified for now, should match AVEVA format)
-            with open(file_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Same JSON layout the gateway reads with -c
+            write_json(file_path, config, indent=True)
             
             self.config_location.set(file_path)
             
             # Save as last config
-            last_config_path = Path.home() / ".aveva_gateway_last_config.json"
-            with open(last_config_path, 'w') as f:
-                json.dump({"last_config": file_path}, f)
+            write_json(self._last_config_path, {"last_config": file_path})
             
             self.status_text.set(f"Configuration saved: {Path(file_path).name}")
             messagebox.showinfo("Success", "Configuration saved successfully!")
@@ -1079,7 +1529,7 @@ Exit Codes:
         """Load configuration"""
         file = filedialog.askopenfilename(
             title="Load Configuration",
-            filetypes=[("XML Files", "*.xml"), ("JSON Files", "*.json"), ("All Files", "*.*")]
+            filetypes=[("JSON Files", "*.json"), ("Legacy Config (*.xml)", "*.xml"), ("All Files", "*.*")]
         )
         
         if file:
@@ -1088,65 +1538,16 @@ Exit Codes:
     def load_config_from_file(self, file_path):
         """Load configuration from file"""
         try:
-            with open(file_path, 'r') as f:
-                config = json.load(f)
+            config = read_config_file(file_path, os.path.getmtime(file_path))
             
             # Apply all settings
-            self.project_name.set(config.get("name", ""))
-            self.source_folder.set(config.get("source_folder", ""))
-            self.destination_folder.set(config.get("destination_folder", ""))
-            self.staging_area.set(config.get("staging_area", ""))
-            self.processed_folder.set(config.get("processed_folder", ""))
-            self.unprocessed_folder.set(config.get("unprocessed_folder", ""))
-            self.log_folder.set(config.get("log_folder", ""))
-            self.pattern_file.set(config.get("pattern_mapping_file", ""))
-            self.default_context.set(config.get("default_context", ""))
-            
-            self.include_subfolders.set(config.get("include_subfolders", True))
-            self.copy_source_files.set(config.get("copy_source_files", True))
-            self.copy_other_files.set(config.get("copy_other_files", False))
-            self.move_processed.set(config.get("move_processed", True))
-            self.search_filenames_for_tags.set(config.get("search_filenames_for_tags", False))
-            self.create_trigger_file.set(config.get("create_trigger_file", True))
-            self.insert_line_breaks.set(config.get("insert_line_breaks", True))
-            self.object_id_from_vnet.set(config.get("object_id_from_vnet", False))
-            
-            self.use_ranges.set(config.get("use_ranges", False))
-            self.document_type.set(config.get("document_type", "xlsx"))
-            
-            self.open_file_timeout_enabled.set(config.get("open_file_timeout_enabled", True))
-            self.open_file_timeout.set(config.get("open_file_timeout", 30))
-            self.processing_timeout_enabled.set(config.get("processing_timeout_enabled", False))
-            self.processing_timeout.set(config.get("processing_timeout", 60.0))
-            self.als_retry_timeout.set(config.get("als_retry_timeout", 120))
-            
-            self.convert_doc.set(config.get("convert_doc", False))
-            self.convert_xls.set(config.get("convert_xls", False))
-            
-            self.use_ocr.set(config.get("use_ocr", True))
-            self.ocr_language.set(config.get("ocr_language", "eng"))
-            self.ocr_dpi.set(config.get("ocr_dpi", 300))
-            self.extract_vertical_text.set(config.get("extract_vertical_text", True))
-            self.rotate_for_ocr.set(config.get("rotate_for_ocr", True))
-            
-            self.adaptive_dpi.set(config.get("adaptive_dpi", True))
-            self.dpi_min.set(config.get("dpi_min", 300))
-            self.dpi_max.set(config.get("dpi_max", 500))
-            self.preprocess_images.set(config.get("preprocess_images", True))
-            self.enhance_contrast.set(config.get("enhance_contrast", 1.5))
-            self.enhance_sharpness.set(config.get("enhance_sharpness", 1.5))
-            self.denoise.set(config.get("denoise", True))
-            self.use_multi_pass_ocr.set(config.get("use_multi_pass_ocr", True))
-            self.detect_regions.set(config.get("detect_regions", True))
-            self.min_text_confidence.set(config.get("min_text_confidence", 60))
-            self.save_debug_images.set(config.get("save_debug_images", False))
+            for key, attr in CONFIG_FIELDS:
+                getattr(self, attr).set(config.get(key, CONFIG_DEFAULTS[key]))
             
             self.config_location.set(file_path)
             
             # Save as last config
-            last_config_path = Path.home() / ".aveva_gateway_last_config.json"
-            with open(last_config_path, 'w') as f:
-                json.dump({"last_config": file_path}, f)
+            write_json(self._last_config_path, {"last_config": file_path})
             
             self.status_text.set(f"Configuration loaded: {Path(file_path).name}")
         
@@ -1164,19 +1565,20 @@ Exit Codes:
     def load_last_config(self):
         """Load last used configuration"""
         try:
-            last_config_path = Path.home() / ".aveva_gateway_last_config.json"
-            if last_config_path.exists():
-                with open(last_config_path, 'r') as f:
-                    data = json.load(f)
-                    last_file = data.get("last_config")
-                    if last_file and Path(last_file).exists():
-                        self.load_config_from_file(last_file)
+            if self._last_config_path.exists():
+                data = read_json(self._last_config_path)
+                last_file = data.get("last_config")
+                if last_file and Path(last_file).exists():
+                    self.load_config_from_file(last_file)
         except:
             pass
     
     def validate_config(self) -> bool:
         """Validate configuration"""
-        if not self.source_folder.get():
+        source_folder = self.source_folder.get()
+        pattern_file = self.pattern_file.get()
+        
+        if not source_folder:
             messagebox.showwarning("Validation", "Please select a source folder.")
             return False
         
@@ -1184,11 +1586,11 @@ Exit Codes:
             messagebox.showwarning("Validation", "Please select a staging area.")
             return False
         
-        if not os.path.exists(self.source_folder.get()):
+        if not os.path.isdir(source_folder):
             messagebox.showwarning("Validation", "Source folder does not exist.")
             return False
         
-        if self.pattern_file.get() and not os.path.exists(self.pattern_file.get()):
+        if pattern_file and not os.path.isfile(pattern_file):
             messagebox.showwarning("Validation", "Pattern file does not exist.")
             return False
         
@@ -1196,11 +1598,15 @@ Exit Codes:
     
     def run_processing(self):
         """Run processing (AVEVA Run button)"""
+        if self.name_tool_running:
+            messagebox.showwarning("Warning", "Please wait for the file name tool to finish.")
+            return
+        
         if not self.validate_config():
             return
         
-        if not GATEWAY_AVAILABLE:
-            messagebox.showerror("Error", "Gateway module not available.")
+        if not self._wait_for_gateway():
+            messagebox.showerror("Error", f"Gateway module not available.\n\n{self.gateway_error}")
             return
         
         # Create folders
@@ -1217,7 +1623,7 @@ Exit Codes:
         self.progress.start(10)
         self.status_text.set("Processing...")
         
-        thread = threading.Thread(target=self.process_thread, daemon=True)
+        thread = threading.Thread(target=self.process_thread, args=(self.get_config(),), daemon=True)
         thread.start()
     
     def monitor_processing(self):
@@ -1225,8 +1631,8 @@ Exit Codes:
         if not self.validate_config():
             return
         
-        if not GATEWAY_AVAILABLE:
-            messagebox.showerror("Error", "Gateway module not available.")
+        if not self._wait_for_gateway():
+            messagebox.showerror("Error", f"Gateway module not available.\n\n{self.gateway_error}")
             return
         
         # Create monitor window
@@ -1241,14 +1647,22 @@ Exit Codes:
         
         self.monitor_running = False
         
+        # Set when the window goes away, so the monitor thread never has to ask Tk
+        closed = threading.Event()
+        
+        def window_closed(event):
+            closed.set()
+        
+        monitor_win.bind('<Destroy>', window_closed)
+        
         def start_monitor():
             self.monitor_running = True
             start_btn.config(state='disabled')
             stop_btn.config(state='normal')
             
-            # Start monitor thread
+            # Start monitor thread (settings are read here, on the Tk thread)
             self.monitor_thread = threading.Thread(
-                target=lambda: self.monitor_thread_func(log_text, monitor_win), 
+                target=self.monitor_thread_func, args=(log_text, self.get_config(), closed), 
                 daemon=True
             )
             self.monitor_thread.start()
@@ -1273,62 +1687,147 @@ Exit Codes:
         
         log_text.insert('1.0', "Monitor ready. Click Start to begin monitoring...\n")
     
-    def monitor_thread_func(self, log_widget, window):
+    def monitor_thread_func(self, log_widget, config_dict, closed):
         """Monitor thread function"""
         try:
-            log_widget.insert('end', f"\n[{datetime.now().strftime('%H:%M:%S')}] Monitoring started...\n")
-            log_widget.see('end')
+            self.root.after(0, self.append_log, log_widget, 
+                            f"\n[{datetime.now().strftime('%H:%M:%S')}] Monitoring started...\n")
             
-            config_dict = self.get_config()
-            config = ProjectConfig.from_dict(config_dict)
+            config = self.gateway_module.ProjectConfig.from_dict(config_dict)
             
-            gateway = DocumentIndexingGateway(config)
+            gateway = self.gateway_module.DocumentIndexingGateway(config)
             
-            if config.pattern_mapping_file and os.path.exists(config.pattern_mapping_file):
-                gateway.load_pattern_mapping(config.pattern_mapping_file)
+            pattern_file = config.pattern_mapping_file
+            if pattern_file and os.path.exists(pattern_file):
+                gateway.load_pattern_mapping(pattern_file)
             
-            processed_files = set()
+            # Files already handled (paths that leave the source folder are forgotten)
+            processed_files = {}
             
-            while self.monitor_running and window.winfo_exists():
-                # Discover files
-                files = gateway.discover_files()
+            if not (WATCHDOG_AVAILABLE and 
+                    self.monitor_events(gateway, config, processed_files, log_widget, closed)):
+                self.monitor_poll(gateway, processed_files, log_widget, closed)
+            
+            self.root.after(0, self.append_log, log_widget, 
+                            f"\n[{datetime.now().strftime('%H:%M:%S')}] Monitoring stopped.\n")
+        
+        except Exception as e:
+            self.root.after(0, self.append_log, log_widget, f"\nMonitor error: {e}\n")
+    
+    def monitor_events(self, gateway, config, processed_files, log_widget, closed):
+        """Process files as watchdog reports them, once they stop changing (False if the folder cannot be watched)"""
+        file_queue = queue.Queue()
+        observer = Observer()
+        try:
+            observer.schedule(QueueingEventHandler(file_queue), config.source_folder, 
+                              recursive=config.include_subfolders)
+            observer.start()
+        except OSError as e:
+            # e.g. inotify watch limit reached, or a share without change notifications
+            self.root.after(0, self.append_log, log_widget, 
+                            f"\nFile events unavailable ({e}), polling the folder instead.\n")
+            return False
+        
+        # Reported files still being written: path -> (signature, time first seen)
+        pending = {}
+        next_rescan = 0
+        
+        try:
+            while self.monitor_running and not closed.is_set():
+                # Rescan at start and then periodically, for files whose events were lost
+                # (event buffer overflows, network shares that report no remote changes)
+                now = time.monotonic()
+                if now >= next_rescan:
+                    files = gateway.discover_files()
+                    for file_path in files:
+                        if file_path not in processed_files:
+                            pending.setdefault(file_path, (None, 0))
+                    self.forget_missing(processed_files, files)
+                    next_rescan = now + MONITOR_RESCAN_INTERVAL
                 
-                for file_path in files:
-                    if file_path not in processed_files:
-                        log_widget.insert('end', f"\n[{datetime.now().strftime('%H:%M:%S')}] Found: {os.path.basename(file_path)}\n")
-                        log_widget.see('end')
-                        
-                        try:
-                            success = gateway.process_file(file_path)
-                            if success:
-                                log_widget.insert('end', f"  ✓ Success\n")
-                            else:
-                                log_widget.insert('end', f"  ✗ Failed\n")
-                        except Exception as e:
-                            log_widget.insert('end', f"  ✗ Error: {e}\n")
-                        
-                        processed_files.add(file_path)
-                        log_widget.see('end')
+                # Collect everything reported since the last pass
+                try:
+                    file_path = file_queue.get(timeout=1)
+                    while True:
+                        ext = os.path.splitext(file_path)[1].lower().lstrip('.')
+                        if ext in config.file_types:
+                            pending[file_path] = (None, 0)
+                        file_path = file_queue.get_nowait()
+                except queue.Empty:
+                    pass
                 
-                time.sleep(2)  # Check every 2 seconds
+                # Process files whose size and mtime have settled (copies may still be running)
+                now = time.monotonic()
+                for file_path, (signature, since) in list(pending.items()):
+                    current = file_signature(file_path)
+                    if current is None:
+                        del pending[file_path]
+                    elif current != signature:
+                        pending[file_path] = (current, now)
+                    elif now - since >= MONITOR_SETTLE_TIME:
+                        del pending[file_path]
+                        self.monitor_process_file(gateway, file_path, processed_files, log_widget)
+        finally:
+            observer.stop()
+            observer.join()
+        
+        return True
+    
+    def monitor_poll(self, gateway, processed_files, log_widget, closed):
+        """Process new files by rescanning the source folder"""
+        while self.monitor_running and not closed.is_set():
+            files = gateway.discover_files()
+            for file_path in files:
+                self.monitor_process_file(gateway, file_path, processed_files, log_widget)
             
-            log_widget.insert('end', f"\n[{datetime.now().strftime('%H:%M:%S')}] Monitoring stopped.\n")
-            log_widget.see('end')
+            self.forget_missing(processed_files, files)
+            closed.wait(MONITOR_POLL_INTERVAL)
+    
+    def forget_missing(self, processed_files, files):
+        """Drop history for files no longer in the source folder (present ones must stay, or they are reprocessed)"""
+        for file_path in processed_files.keys() - set(files):
+            del processed_files[file_path]
+    
+    def monitor_process_file(self, gateway, file_path, processed_files, log_widget):
+        """Process one monitored file unless it was handled already"""
+        # None = processed; a signature = failed, retried once the file changes
+        if file_path in processed_files:
+            previous = processed_files[file_path]
+            if previous is None or previous == file_signature(file_path):
+                return
         
+        signature = file_signature(file_path)
+        ts = datetime.now().strftime('%H:%M:%S')
+        try:
+            success = gateway.process_file(file_path)
+            result = "✓ Success" if success else "✗ Failed"
         except Exception as e:
-            log_widget.insert('end', f"\nMonitor error: {e}\n")
+            success = False
+            result = f"✗ Error: {e}"
+        
+        if success or signature is not None:
+            processed_files[file_path] = None if success else signature
+        
+        # One log update per file
+        self.root.after(0, self.append_log, log_widget, 
+                        f"\n[{ts}] Found: {os.path.basename(file_path)}\n  {result}\n")
+    
+    def append_log(self, log_widget, text):
+        """Append text to a log widget and scroll to it (Tk thread only)"""
+        if log_widget.winfo_exists():
+            log_widget.insert('end', text)
             log_widget.see('end')
     
-    def process_thread(self):
+    def process_thread(self, config_dict):
         """Processing thread"""
         try:
-            config_dict = self.get_config()
-            config = ProjectConfig.from_dict(config_dict)
+            config = self.gateway_module.ProjectConfig.from_dict(config_dict)
             
-            gateway = DocumentIndexingGateway(config)
+            gateway = self.gateway_module.DocumentIndexingGateway(config)
             
-            if config.pattern_mapping_file and os.path.exists(config.pattern_mapping_file):
-                gateway.load_pattern_mapping(config.pattern_mapping_file)
+            pattern_file = config.pattern_mapping_file
+            if pattern_file and os.path.exists(pattern_file):
+                gateway.load_pattern_mapping(pattern_file)
             
             gateway.process_batch()
             
@@ -1344,7 +1843,8 @@ Exit Codes:
         self.run_button.config(state='normal')
         self.monitor_button.config(state='normal')
         self.stop_button.config(state='disabled')
-        self.progress.stop()
+        if not self.name_tool_running:
+            self.progress.stop()
         
         self.status_text.set(f"Complete: {processed} processed, {failed} failed")
         
@@ -1360,7 +1860,8 @@ Exit Codes:
         self.run_button.config(state='normal')
         self.monitor_button.config(state='normal')
         self.stop_button.config(state='disabled')
-        self.progress.stop()
+        if not self.name_tool_running:
+            self.progress.stop()
         
         self.status_text.set("Error occurred")
         messagebox.showerror("Processing Error", f"Processing failed:\n\n{error}")
@@ -1387,6 +1888,7 @@ Exit Codes:
             return
         
         try:
+            import webbrowser
             webbrowser.open(f"file://{os.path.abspath(report_file)}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open report:\n{e}")
@@ -1400,24 +1902,7 @@ Exit Codes:
     
     def show_about(self):
         """Show about dialog"""
-        about_text = """Document Indexing Gateway
-Complete Edition with Advanced OCR
-
-Version: 5.0.11 + OCR Enhanced
-Release: January 2026
-
-Features:
-• Complete AVEVA NET specification compliance
-• Advanced OCR with intelligent preprocessing
-• Multi-pass OCR for complex P&IDs
-• Vertical and rotated text extraction
-• Monitor mode with real-time updates
-• File validation and fixing
-• Comprehensive error handling
-
-Python GUI Implementation"""
-        
-        messagebox.showinfo("About", about_text)
+        messagebox.showinfo("About", ABOUT_TEXT)
 
 
 def main():